@@ -51,14 +51,13 @@ def match_partial_url(valid_url: ParseResult, partial_url: str) -> bool:
         if valid_url.scheme != parsed.scheme:
             return False
 
-    if any(
-        (
-            (parsed.hostname and valid_url.hostname != parsed.hostname),
-            (parsed.username and valid_url.username != parsed.username),
-            (parsed.port and valid_url.port != parsed.port),
-            (parsed.path and parsed.path.rstrip("/") != valid_url.path.rstrip("/")),
-        ),
-    ):
+    if parsed.hostname and valid_url.hostname != parsed.hostname:
+        return False
+    if parsed.username and valid_url.username != parsed.username:
+        return False
+    if parsed.port and valid_url.port != parsed.port:
+        return False
+    if parsed.path and parsed.path.rstrip("/") != valid_url.path.rstrip("/"):
         return False
 
     return True
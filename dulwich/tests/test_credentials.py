@@ -48,6 +48,14 @@ class TestCredentialHelpersUtils(TestCase):
         self.assertFalse(match_partial_url(url, "github.com/jel"))
         self.assertFalse(match_partial_url(url, "github.com/jel/"))
 
+    def test_match_partial_url_user_port(self):
+        url = urlparse("https://jelmer@github.com:8443/jelmer/dulwich")
+        self.assertTrue(match_partial_url(url, "jelmer@github.com"))
+        self.assertFalse(match_partial_url(url, "dtrifiro@github.com"))
+        self.assertTrue(match_partial_url(url, "github.com:8443"))
+        self.assertFalse(match_partial_url(url, "github.com:443"))
+        self.assertFalse(match_partial_url(url, "http://github.com"))
+
     def test_urlmatch_credential_sections(self):
         config = ConfigDict()
         config.set((b"credential", "https://github.com"), b"helper", "foo")